@@ -0,0 +1,85 @@
+"""
+Helpers to defer (and time) imports of heavy or optional modules.
+Only imports that go through `timed_import`/`lazy_import` (plus `django.setup` in `src.preload`) are timed.
+For a full per-module breakdown of a process' startup, use `python -X importtime ...`.
+"""
+from contextlib import contextmanager
+from types import ModuleType
+from typing import Dict, Iterator
+import importlib
+import sys
+import time
+
+# module name -> seconds spent importing it (through `timed_import` or `record_import_time`)
+_import_timings: Dict[str, float] = {}
+
+
+@contextmanager
+def record_import_time(name: str) -> Iterator[None]:
+    """Records the time spent in the `with` block as import time of `name`."""
+    start = time.perf_counter()
+    yield
+    _import_timings[name] = time.perf_counter() - start
+
+
+def timed_import(name: str) -> ModuleType:
+    """
+    Imports a module (by dotted path) and records how long the import took.
+    Modules that were already imported are returned as is (and not timed again).
+
+    Args:
+        name (str): Dotted module path, e.g. `requests`.
+
+    Returns:
+        ModuleType: The imported module.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    with record_import_time(name):
+        module = importlib.import_module(name)
+    return module
+
+
+def get_import_timings() -> Dict[str, float]:
+    """Returns the recorded import times (in seconds) per module, slowest first."""
+    return dict(sorted(_import_timings.items(), key=lambda kv: kv[1], reverse=True))
+
+
+class LazyModule(ModuleType):
+    """
+    Placeholder for a module that is only imported on first attribute access.
+    Use it for heavy or optional dependencies that aren't needed at import time of the caller,
+    e.g. `requests = lazy_import("requests")` at module level.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_lazy_module"] = None
+
+    def _load(self) -> ModuleType:
+        module = self.__dict__["_lazy_module"]
+        if module is None:
+            module = timed_import(self.__name__)
+            self.__dict__["_lazy_module"] = module
+        return module
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.__dict__["_lazy_module"] is not None else "not loaded"
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Returns the module if it has already been imported, otherwise a `LazyModule` for it.
+
+    Args:
+        name (str): Dotted module path, e.g. `requests`.
+
+    Returns:
+        ModuleType: The module (or its lazy placeholder).
+    """
+    return sys.modules.get(name) or LazyModule(name)
@@ -1,16 +1,132 @@
-from typing import Optional
-import collections
+from typing import Any, Dict, IO, Iterable, Iterator, List, Optional, Tuple
+import collections.abc
+from common_utils.import_utils import lazy_import
+
+ijson = lazy_import("ijson")
+
+# ijson events that carry a (leaf) value
+_SCALAR_EVENTS = frozenset(("null", "boolean", "integer", "double", "number", "string"))
 
 
 # from: https://stackoverflow.com/questions/6027558/flatten-nested-dictionaries-compressing-keys
 def flatten_dict_by_joining(
-    d: collections.Mapping, parent_key: Optional[str] = "", sep: Optional[str] = "-"
-) -> collections.Mapping:
+    d: collections.abc.Mapping,
+    parent_key: Optional[str] = "",
+    sep: Optional[str] = "-",
+) -> collections.abc.Mapping:
     items = []
     for k, v in d.items():
         new_k = sep.join([parent_key, k]) if parent_key else k
-        if isinstance(v, collections.Mapping):
+        if isinstance(v, collections.abc.Mapping):
             items.extend(flatten_dict_by_joining(v, new_k, sep=sep).items())
         else:
             items.append((new_k, v))
     return dict(items)
+
+
+def iter_flattened_items(
+    stream: IO[bytes], sep: Optional[str] = "-"
+) -> Iterator[Tuple[str, Any]]:
+    """
+    Incrementally decodes a JSON object and yields every leaf value with its flattened key.
+    Yields the same items as `flatten_dict_by_joining`, but the document is never held in memory as a whole.
+    Same as there, arrays are leaves: each array is decoded (as a whole) into a list.
+
+    Args:
+        stream (IO[bytes]): A file-like object holding a JSON document (e.g. a streamed response body).
+        sep (Optional[str], optional): Separator to join nested keys with. Defaults to "-".
+
+    Yields:
+        Iterator[Tuple[str, Any]]: (flattened key, value) pairs in document order.
+
+    Raises:
+        ValueError: If the document isn't a JSON object.
+    """
+    # keys are tracked from the `map_key` events (ijson's prefixes can't tell `a.b` from `{"a": {"b"}}`)
+    keys = []
+    events = ijson.parse(stream, use_float=True)
+    for _, event, value in events:
+        if event == "start_map":
+            keys.append(None)
+        elif event == "map_key":
+            keys[-1] = value
+        elif event == "end_map":
+            keys.pop()
+        elif not keys:
+            raise ValueError(f"Expected a JSON object, got: {event}")
+        elif event == "start_array":
+            yield sep.join(keys), _build_array(events)
+        elif event in _SCALAR_EVENTS:
+            yield sep.join(keys), value
+
+
+def _build_array(events: Iterator[Tuple[str, str, Any]]) -> List[Any]:
+    # consumes the events of an array (whose `start_array` was already consumed)
+    builder = ijson.ObjectBuilder()
+    builder.event("start_array", None)
+    depth = 1
+    for _, event, value in events:
+        builder.event(event, value)
+        if event == "start_array" or event == "start_map":
+            depth += 1
+        elif event == "end_array" or event == "end_map":
+            depth -= 1
+            if depth == 0:
+                break
+    return builder.value
+
+
+def extract_flattened_fields(
+    stream: IO[bytes], keys: Iterable[str], sep: Optional[str] = "-"
+) -> Dict[str, Any]:
+    """
+    Picks the given flattened keys out of a JSON document.
+    Stops decoding as soon as all keys were found.
+
+    Args:
+        stream (IO[bytes]): A file-like object holding a JSON document.
+        keys (Iterable[str]): Flattened keys (see `iter_flattened_items`) to extract.
+        sep (Optional[str], optional): Separator the keys are joined with. Defaults to "-".
+
+    Returns:
+        Dict[str, Any]: The found keys and their values (missing keys are omitted).
+    """
+    wanted = set(keys)
+    found = {}
+    for k, v in iter_flattened_items(stream, sep=sep):
+        if k in wanted:
+            found[k] = v
+            if len(found) == len(wanted):
+                break
+    return found
+
+
+def iter_mapped_records(
+    stream: IO[bytes],
+    prefix: str,
+    mapper: Dict[str, str],
+    by_key: Optional[bool] = False,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Incrementally decodes the objects found at `prefix` and yields them one by one,
+    renamed according to `mapper` and reduced to its keys.
+    Only a single record is held in memory at any time.
+    Examples (ijson prefix notation):
+        > `[{...}, {...}]` -> prefix="item"
+        > `{"data": {"Aatrox": {...}, "Ahri": {...}}}` -> prefix="data", by_key=True
+
+    Args:
+        stream (IO[bytes]): A file-like object holding a JSON document.
+        prefix (str): ijson prefix of the array items (or of the object, if `by_key`).
+        mapper (Dict[str, str]): API key -> model field name.
+        by_key (Optional[bool], optional): If True, iterate the values of the object at `prefix`. Defaults to False.
+
+    Yields:
+        Iterator[Dict[str, Any]]: Model-ready records ({model field: value}).
+    """
+    if by_key:
+        records = (v for _, v in ijson.kvitems(stream, prefix, use_float=True))
+    else:
+        records = ijson.items(stream, prefix, use_float=True)
+    for record in records:
+        yield {v: record[k] for k, v in mapper.items()}
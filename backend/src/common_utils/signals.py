@@ -0,0 +1,18 @@
+from django.db import models
+from django.dispatch import Signal
+
+# Sent after `QuerySet.bulk_create` (which doesn't send `post_save`).
+# Arguments: `sender` (the model class), `instances` (the created objects).
+post_bulk_create = Signal()
+
+
+class BulkSignalQuerySet(models.QuerySet):
+    """
+    QuerySet that sends `post_bulk_create` after `bulk_create`.
+    Use as `objects = BulkSignalQuerySet.as_manager()`.
+    """
+
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = super().bulk_create(objs, *args, **kwargs)
+        post_bulk_create.send(sender=self.model, instances=objs)
+        return objs
@@ -0,0 +1,31 @@
+import io
+import json
+from django.test import SimpleTestCase
+
+from common_utils import json_utils
+
+
+class IterFlattenedItemsTest(SimpleTestCase):
+    def test_items_equal_flatten_dict_by_joining(self):
+        doc = {
+            "n": {"item": "10.1", "tags": ["a", {"b": [1]}], "c.d": 2},
+            "e.f": {"g": True},
+            "empty": {},
+            "cdn": None,
+        }
+        stream = io.BytesIO(json.dumps(doc).encode())
+
+        items = dict(json_utils.iter_flattened_items(stream))
+
+        self.assertEqual(items, json_utils.flatten_dict_by_joining(doc))
+
+    def test_extract_list_valued_field(self):
+        stream = io.BytesIO(b'{"n": {"tags": ["a", "b"]}, "cdn": "c"}')
+
+        fields = json_utils.extract_flattened_fields(stream, ["n-tags"])
+
+        self.assertEqual(fields, {"n-tags": ["a", "b"]})
+
+    def test_rejects_non_object_documents(self):
+        with self.assertRaises(ValueError):
+            list(json_utils.iter_flattened_items(io.BytesIO(b"[1, 2]")))
@@ -1,6 +1,6 @@
 from datetime import datetime
 import pytz
-from src.settings import TIME_ZONE as _django_settings_time_zone
+from django.conf import settings
 
 
 def get_tz_aware_dt_from_timestamp(timestamp: float) -> datetime:
@@ -14,7 +14,7 @@ def get_tz_aware_dt_from_timestamp(timestamp: float) -> datetime:
     Returns:
         datetime: A django-native TZ-aware datetime object
     """
-    tz = pytz.timezone(zone=_django_settings_time_zone)
+    tz = pytz.timezone(zone=settings.TIME_ZONE)
     # this method is superior to `make_aware` to avoid conflicts with system specifications.
     # read: https://stackoverflow.com/questions/12589764/unix-timestamp-to-datetime-in-django-with-timezone/32163867#32163867
     return datetime.fromtimestamp(timestamp, tz)
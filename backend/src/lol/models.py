@@ -1,9 +1,10 @@
-from typing import Dict, Union
+from typing import IO, Dict, Iterator, Union
 from datetime import datetime, timedelta
 from numbers import Number
 import warnings
 from django.db import models
 from common_utils import json_utils, time_utils
+from common_utils.signals import BulkSignalQuerySet
 
 
 class Game(models.Model):
@@ -16,6 +17,9 @@ class Game(models.Model):
     role = models.CharField(max_length=32, blank=True, null=True)
     lane = models.CharField(max_length=32, blank=True, null=True)
 
+    # bulk ingestion has to be visible to the change capture (see `matching.signals`)
+    objects = BulkSignalQuerySet.as_manager()
+
     def pre_save(self, *args, **kwargs):
         if isinstance(self.timestamp, Number):
             self.timestamp = time_utils.get_tz_aware_dt_from_timestamp(self.timestamp)
@@ -81,6 +85,13 @@ class Version(models.Model):
             formatted_response[v] = api_response.pop(k)
         return cls(**formatted_response)
 
+    @classmethod
+    def _from_api_stream(cls, stream: IO[bytes]) -> "Version":
+        # only the mapped fields are decoded, the rest of the document is skipped
+        mapper = cls._get_api_model_map()
+        api_response = json_utils.extract_flattened_fields(stream, mapper.keys())
+        return cls(**{v: api_response[k] for k, v in mapper.items()})
+
     @property
     def last_version(self):
         version = self.objects.latest(field_name="date_added")
@@ -154,6 +165,13 @@ class Champion(models.Model):
         else:
             raise AttributeError(f"invalid mode!")
 
+    @classmethod
+    def _iter_from_api_stream(cls, stream: IO[bytes]) -> Iterator[Dict[str, str]]:
+        """Yields one model-ready dict per champion of a (streamed) `champion.json` document."""
+        return json_utils.iter_mapped_records(
+            stream, "data", cls._get_api_model_map(), by_key=True
+        )
+
     def save(self, version: Version = None, *args, **kwargs):
         if version:
             self.splash = self._construct_full_splash_url(version)
@@ -191,6 +209,17 @@ class Queue(models.Model):
             single_queue_map[v] = single_queue_map.pop(k)
         return cls(**single_queue_map)
 
+    @classmethod
+    def _iter_from_api_stream(cls, stream: IO[bytes]) -> Iterator["Queue"]:
+        """Yields one (unsaved) instance per queue of a (streamed) `queues.json` document."""
+        mapper = {
+            **cls._get_api_model_map(),
+            "description": "description",
+            "notes": "notes",
+        }
+        for record in json_utils.iter_mapped_records(stream, "item", mapper):
+            yield cls(**record)
+
 
 class Item(models.Model):
     id = models.IntegerField(primary_key=True)
@@ -1,11 +1,64 @@
-from typing import List, Optional
-import requests
+from contextlib import contextmanager
+from itertools import islice
+from typing import IO, Iterable, Iterator, List, Optional, TypeVar
+from django.db import transaction
+from common_utils.import_utils import lazy_import
 from lol.models import Version, Champion, Queue
-from lol.riot_interface.client_secrets import X_RIOT_TOKEN
-from riotwatcher import LolWatcher
+
+# only needed when actually fetching; keeps imports of this module cheap
+ijson = lazy_import("ijson")
+requests = lazy_import("requests")
+urllib3 = lazy_import("urllib3")
 
 _DEFAULT_REGION = "euw1"
+# platform id -> DDragon realm
+_PLATFORM_REALMS = {
+    "br1": "br",
+    "eun1": "eune",
+    "euw1": "euw",
+    "jp1": "jp",
+    "kr": "kr",
+    "la1": "lan",
+    "la2": "las",
+    "na1": "na",
+    "oc1": "oce",
+    "ru": "ru",
+    "tr1": "tr",
+}
+_DDRAGON_URI = "https://ddragon.leagueoflegends.com"
+_VERSIONS_JSON_URI = _DDRAGON_URI + "/realms/{region}.json"
+_CHAMPIONS_JSON_URI = _DDRAGON_URI + "/cdn/{version}/data/{locale}/champion.json"
 _QUEUES_JSON_URI = "http://static.developer.riotgames.com/docs/lol/queues.json"
+_DEFAULT_LOCALE = "en_US"
+_QUEUE_BATCH_SIZE = 100
+# (connect, read) timeouts in seconds
+_REQUEST_TIMEOUT = (5, 30)
+
+T = TypeVar("T")
+
+
+def _batched(iterable: Iterable[T], batch_size: int) -> Iterator[List[T]]:
+    # `bulk_create` materializes its whole input, so we feed it bounded chunks
+    it = iter(iterable)
+    while True:
+        batch = list(islice(it, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+@contextmanager
+def _stream_json(url: str) -> Iterator[IO[bytes]]:
+    """
+    Opens a streamed GET request and yields the (decompressed) raw response body.
+    The body is decoded incrementally by the consumer, so it is never loaded as a whole.
+    NOTE: errors while reading the body (e.g. a dropped connection) are raised by urllib3
+    and NOT wrapped into `requests.exceptions.RequestException`.
+    """
+    with requests.get(url=url, stream=True, timeout=_REQUEST_TIMEOUT) as r:
+        r.raise_for_status()
+        r.raw.decode_content = True
+        yield r.raw
 
 
 def fetch_static_data(also_fetch_queues: Optional[bool] = False) -> None:
@@ -18,68 +71,71 @@ def fetch_static_data(also_fetch_queues: Optional[bool] = False) -> None:
     Args:
         also_fetch_queues (Optional[bool], optional): If True, also fetches queue_types. This is generally not necessary (outside of initial loads). Defaults to False.
     """
-    watcher = LolWatcher(api_key=X_RIOT_TOKEN)
-    version = fetch_and_save_version(watcher=watcher)
-    fetch_and_write_champs(watcher=watcher, version=version)
+    version = fetch_and_save_version()
+    fetch_and_write_champs(version=version)
     if also_fetch_queues:
-        fetch_and_write_queue_types(watcher=watcher)
+        fetch_and_write_queue_types()
 
 
-def fetch_and_save_version(
-    watcher: LolWatcher, for_region: Optional[str] = None
-) -> Version:
+def fetch_and_save_version(for_region: Optional[str] = None) -> Version:
     """
     Fetches the newest game version(s) and saves a new instance to the DB.
     """
     # versions are region specific.
     # This should almost never be an issue, but regions can be on different patches.
     for_region = for_region or _DEFAULT_REGION
-    versions_resp = watcher.data_dragon.versions_for_region(for_region)
-    version = Version._from_api_dict(api_response=versions_resp)
+    try:
+        realm = _PLATFORM_REALMS[for_region.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown platform: {for_region}")
+    with _stream_json(_VERSIONS_JSON_URI.format(region=realm)) as stream:
+        version = Version._from_api_stream(stream)
     version.save()
     return version
 
 
-def fetch_and_write_champs(watcher: LolWatcher, version: Version) -> None:
+def fetch_and_write_champs(version: Version) -> None:
     """
     Fetches all current champs, and either updates existing ones or writes new instances.
+    Champions are decoded and written one at a time, straight from the response stream.
 
     Args:
-        watcher (LolWatcher): Current watcher to query DDragon with.
         version (Version): A valid version.
     """
-    api_response = watcher.data_dragon.champions(version=version.champion)
-    for raw_champ_data in api_response["data"].values():
-        champ_dict = Champion._from_single_champ_dict(raw_champ_data, mode="dict")
-        # TODO(jonas): this is a little less ugly
-        unique_checks = {"id": champ_dict["id"]}
-        remaining_attrs = {
-            k: v for k, v in champ_dict.items() if k not in unique_checks
-        }
-        champ, _ = Champion.objects.update_or_create(
-            **unique_checks, defaults=remaining_attrs
-        )
-        champ.save(version=version)
-
-
-def fetch_and_write_queue_types(watcher: LolWatcher) -> None:
+    url = _CHAMPIONS_JSON_URI.format(version=version.champion, locale=_DEFAULT_LOCALE)
+    with _stream_json(url) as stream:
+        for champ_dict in Champion._iter_from_api_stream(stream):
+            # TODO(jonas): this is a little less ugly
+            unique_checks = {"id": champ_dict["id"]}
+            remaining_attrs = {
+                k: v for k, v in champ_dict.items() if k not in unique_checks
+            }
+            champ, _ = Champion.objects.update_or_create(
+                **unique_checks, defaults=remaining_attrs
+            )
+            champ.save(version=version)
+
+
+def fetch_and_write_queue_types() -> None:
     """
     Fetches and saves to the database all queue types (e.g. SR RANKED SOLO/DUO).
     If fetching of data is successful, current queues are deleted.
-
-    Args:
-        watcher (LolWatcher): Current LolWatcher instance.
     """
     try:
-        r = requests.get(url=_QUEUES_JSON_URI)
-        r.raise_for_status()
-        data = r.json()
-        # since this won't be loaded often and it's a wholistic truth, we can safely whipe the table.
-        Queue.objects.all().delete()
-        for queue in data:
+        with _stream_json(_QUEUES_JSON_URI) as stream, transaction.atomic():
+            # since this won't be loaded often and it's a wholistic truth, we can safely whipe the table.
+            # (rolled back if the stream breaks halfway through)
+            Queue.objects.all().delete()
             # write them all to the database
-            Queue._from_api_dict(queue).save()
-    except requests.exceptions.RequestException as e:
+            for batch in _batched(
+                Queue._iter_from_api_stream(stream), _QUEUE_BATCH_SIZE
+            ):
+                Queue.objects.bulk_create(batch)
+    except (
+        requests.exceptions.RequestException,
+        urllib3.exceptions.HTTPError,
+        ijson.JSONError,
+    ) as e:
         # extremely generic exception to avoid causing issues in application
         # if we somehow encountered an error, safely abort
-        print(f"Error fetching queues: Error encountered:\n{e}")
\ No newline at end of file
+        print(f"Error fetching queues: Error encountered:\n{e}")
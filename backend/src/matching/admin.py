@@ -0,0 +1,4 @@
+from django.contrib import admin
+from .models import ChangeRecord
+
+admin.site.register(ChangeRecord)
@@ -0,0 +1,9 @@
+from django.apps import AppConfig
+
+
+class MatchingConfig(AppConfig):
+    name = "matching"
+
+    def ready(self):
+        # connects the change capture receivers
+        from matching import signals  # noqa: F401
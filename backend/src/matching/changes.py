@@ -0,0 +1,187 @@
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+import logging
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from django.utils.module_loading import import_string
+from matching.models import ChangeRecord
+from messaging.models import Participant
+
+logger = logging.getLogger(__name__)
+
+# user_id (None for changes without a user, e.g. games) -> source -> changed object id -> last action
+CoalescedChanges = Dict[Optional[int], Dict[str, Dict[str, str]]]
+
+
+class Change(NamedTuple):
+    source: str
+    object_id: str
+    user_id: Optional[int] = None
+    # participant that authored the change (messages), resolved to `user_id` by the consumer
+    author_id: Optional[int] = None
+
+
+_DEFAULT_BATCH_SIZE = 500
+_DEFAULT_MAX_ATTEMPTS = 5
+_DEFAULT_RETRY_DELAY = 300
+
+
+def record_changes(
+    changes: Iterable[Change], action: str = ChangeRecord.Action.SAVED
+) -> None:
+    """
+    Appends change records to the queue (in the caller's transaction, if any).
+
+    Args:
+        changes (Iterable[Change]): The changes to record.
+        action (str, optional): A `ChangeRecord.Action`. Defaults to SAVED.
+    """
+    ChangeRecord.objects.bulk_create(
+        [
+            ChangeRecord(
+                source=change.source,
+                action=action,
+                object_id=str(change.object_id),
+                user_id=change.user_id,
+                author_id=change.author_id,
+            )
+            for change in changes
+        ]
+    )
+
+
+def coalesce(rows: Iterable[Tuple[str, str, Optional[int], str]]) -> CoalescedChanges:
+    """
+    Folds change rows into one entry per user, deduplicating repeated changes of the same object.
+    Only the last action (`ChangeRecord.Action`) per object is kept, e.g. saved -> deleted yields deleted.
+
+    Args:
+        rows (Iterable[Tuple[str, str, Optional[int], str]]): (source, object_id, user_id, action) rows, oldest first.
+
+    Returns:
+        CoalescedChanges: user_id -> source -> changed object id -> last action.
+    """
+    changes = defaultdict(lambda: defaultdict(dict))
+    for source, object_id, user_id, action in rows:
+        changes[user_id][source][object_id] = action
+    return {user_id: dict(by_source) for user_id, by_source in changes.items()}
+
+
+def _resolve_authors(
+    rows: List[Tuple[str, str, Optional[int], Optional[int], str]],
+) -> List[Tuple[str, str, Optional[int], str]]:
+    # (source, object_id, user_id, author_id, action) -> (source, object_id, user_id, action)
+    # one query per batch, instead of one per captured message
+    # authors that were deleted in the meantime resolve to `None`
+    author_ids = {
+        author_id for _, _, user_id, author_id, _ in rows if author_id and not user_id
+    }
+    user_ids = (
+        dict(Participant.objects.filter(id__in=author_ids).values_list("id", "user_id"))
+        if author_ids
+        else {}
+    )
+    return [
+        (source, object_id, user_id or user_ids.get(author_id), action)
+        for source, object_id, user_id, author_id, action in rows
+    ]
+
+
+def get_refreshers() -> List[Callable[[CoalescedChanges], None]]:
+    """Callables (`settings.CHANGE_CAPTURE_REFRESHERS`) that incrementally update derived data."""
+    return [
+        import_string(path)
+        for path in getattr(settings, "CHANGE_CAPTURE_REFRESHERS", ())
+    ]
+
+
+def _apply(
+    ids: List[int],
+    rows: List[Tuple[str, str, Optional[int], str]],
+    refreshers: List[Callable[[CoalescedChanges], None]],
+) -> None:
+    changes = coalesce(rows)
+    for refresher in refreshers:
+        refresher(changes)
+    ChangeRecord.objects.filter(id__in=ids).delete()
+
+
+def _record_failure(ids: List[int], now: datetime) -> int:
+    # returns the number of records that reached the max. attempts (and are now marked as failed)
+    max_attempts = getattr(
+        settings, "CHANGE_CAPTURE_MAX_ATTEMPTS", _DEFAULT_MAX_ATTEMPTS
+    )
+    retry_delay = getattr(settings, "CHANGE_CAPTURE_RETRY_DELAY", _DEFAULT_RETRY_DELAY)
+    records = ChangeRecord.objects.filter(id__in=ids)
+    records.update(
+        attempts=F("attempts") + 1, retry_after=now + timedelta(seconds=retry_delay)
+    )
+    return records.filter(attempts__gte=max_attempts).update(failed_at=now)
+
+
+def apply_next_batch(batch_size: Optional[int] = None) -> int:
+    """
+    Takes the oldest due change records, coalesces them per user and hands them to all refreshers.
+    Records are only deleted once every refresher succeeded.
+    If the batch fails, it's retried user by user, so a single failing user doesn't hold back everybody else.
+    The records of a failing user are retried after `CHANGE_CAPTURE_RETRY_DELAY` seconds
+    and marked as failed (no longer consumed) after `CHANGE_CAPTURE_MAX_ATTEMPTS` attempts.
+    Concurrent consumers skip rows that are locked by another consumer (where the DB supports it).
+
+    Args:
+        batch_size (Optional[int], optional): Max. records to apply. Defaults to `settings.CHANGE_CAPTURE_BATCH_SIZE`.
+
+    Returns:
+        int: Number of processed (applied or failed) records (0 if no record is due).
+    """
+    batch_size = batch_size or getattr(
+        settings, "CHANGE_CAPTURE_BATCH_SIZE", _DEFAULT_BATCH_SIZE
+    )
+    refreshers = get_refreshers()
+    now = timezone.now()
+    failed = 0
+    with transaction.atomic():
+        rows = list(
+            ChangeRecord.objects.select_for_update(skip_locked=True)
+            .filter(failed_at__isnull=True)
+            .filter(Q(retry_after__isnull=True) | Q(retry_after__lte=now))
+            .order_by("id")
+            .values_list("id", "source", "object_id", "user_id", "author_id", "action")[
+                :batch_size
+            ]
+        )
+        if not rows:
+            return 0
+        ids = [row[0] for row in rows]
+        resolved = _resolve_authors([row[1:] for row in rows])
+        try:
+            # savepoint: a failing refresher only rolls back this block
+            with transaction.atomic():
+                _apply(ids, resolved, refreshers)
+        except Exception:
+            logger.exception(
+                f"Applying {len(rows)} change records failed, retrying per user."
+            )
+            by_user = defaultdict(lambda: ([], []))
+            for id_, row in zip(ids, resolved):
+                user_ids, user_rows = by_user[row[2]]
+                user_ids.append(id_)
+                user_rows.append(row)
+            for user_id, (user_ids, user_rows) in by_user.items():
+                try:
+                    with transaction.atomic():
+                        _apply(user_ids, user_rows, refreshers)
+                except Exception:
+                    logger.exception(
+                        f"Applying change records of user {user_id} failed."
+                    )
+                    failed += len(user_ids)
+                    if _record_failure(user_ids, now):
+                        logger.error(
+                            f"Change records of user {user_id} reached the max. attempts and were marked as failed."
+                        )
+    logger.info(f"Processed {len(rows)} change records ({failed} failed).")
+    return len(rows)
@@ -0,0 +1,45 @@
+from django.db import models
+
+
+class ChangeRecord(models.Model):
+    """
+    A compact record of a change that makes derived matching data stale
+    (e.g. player features, filter indexes, swipe decks, synergy aggregates).
+    Records are written in the same transaction as the change itself (see `matching.signals`),
+    so the table acts as a durable queue. They are consumed (and deleted) in micro-batches
+    by `matching.tasks.process_change_records`.
+    WARNING: `QuerySet.update()` (and raw SQL) doesn't send model signals, so changes like
+    `Participant.objects.filter(...).update(is_active=False)` are NOT captured.
+    Record those explicitly with `matching.changes.record_changes`.
+    """
+
+    class Source(models.TextChoices):
+        GAME = "game"
+        PARTICIPANT = "participant"
+        MESSAGE = "message"
+
+    class Action(models.TextChoices):
+        SAVED = "saved"
+        DELETED = "deleted"
+
+    id = models.BigAutoField(primary_key=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    source = models.CharField(max_length=16, choices=Source.choices)
+    action = models.CharField(
+        max_length=16, choices=Action.choices, default=Action.SAVED
+    )
+    # the changed object: games -> Riot game id, participants -> channel id, messages -> primary key
+    object_id = models.CharField(max_length=64)
+    # the affected user, if the change can be attributed to one (games can't)
+    # NOTE: no FK on purpose: records must survive the deletion of the user they refer to
+    user_id = models.IntegerField(blank=True, null=True)
+    # the authoring participant (messages), mapped to `user_id` when the record is consumed
+    author_id = models.IntegerField(blank=True, null=True)
+    # failed applications (see `matching.changes.apply_next_batch`)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    retry_after = models.DateTimeField(blank=True, null=True)
+    # set once `CHANGE_CAPTURE_MAX_ATTEMPTS` is reached; failed records are no longer consumed
+    failed_at = models.DateTimeField(blank=True, null=True, db_index=True)
+
+    class Meta:
+        ordering = ["id"]
@@ -0,0 +1,74 @@
+"""
+Change capture: every save/delete (and bulk create) of a model that feeds derived matching data
+appends a `ChangeRecord`. Connected in `MatchingConfig.ready`.
+NOTE: `QuerySet.update()` is not captured (see `ChangeRecord`).
+"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from common_utils.signals import post_bulk_create
+from lol.models import Game
+from matching.changes import Change, record_changes
+from matching.models import ChangeRecord
+from messaging.models import Message, Participant
+
+_Source = ChangeRecord.Source
+_Action = ChangeRecord.Action
+
+
+def _game_change(game: Game) -> Change:
+    return Change(_Source.GAME, game.game)
+
+
+def _participant_change(participant: Participant) -> Change:
+    return Change(_Source.PARTICIPANT, participant.channel_id, participant.user_id)
+
+
+def _message_change(message: Message) -> Change:
+    # messages only know their author (a participant), the user is resolved by the consumer
+    return Change(_Source.MESSAGE, message.pk, author_id=message.author_id)
+
+
+@receiver(post_save, sender=Game)
+def capture_game_save(sender, instance, **kwargs):
+    record_changes([_game_change(instance)])
+
+
+@receiver(post_delete, sender=Game)
+def capture_game_delete(sender, instance, **kwargs):
+    record_changes([_game_change(instance)], action=_Action.DELETED)
+
+
+@receiver(post_save, sender=Participant)
+def capture_participant_save(sender, instance, **kwargs):
+    record_changes([_participant_change(instance)])
+
+
+@receiver(post_delete, sender=Participant)
+def capture_participant_delete(sender, instance, **kwargs):
+    record_changes([_participant_change(instance)], action=_Action.DELETED)
+
+
+@receiver(post_save, sender=Message)
+def capture_message_save(sender, instance, **kwargs):
+    record_changes([_message_change(instance)])
+
+
+@receiver(post_delete, sender=Message)
+def capture_message_delete(sender, instance, **kwargs):
+    record_changes([_message_change(instance)], action=_Action.DELETED)
+
+
+@receiver(post_bulk_create, sender=Game)
+def capture_game_bulk_create(sender, instances, **kwargs):
+    record_changes([_game_change(game) for game in instances])
+
+
+@receiver(post_bulk_create, sender=Participant)
+def capture_participant_bulk_create(sender, instances, **kwargs):
+    record_changes([_participant_change(p) for p in instances])
+
+
+@receiver(post_bulk_create, sender=Message)
+def capture_message_bulk_create(sender, instances, **kwargs):
+    record_changes([_message_change(message) for message in instances])
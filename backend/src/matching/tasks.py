@@ -0,0 +1,54 @@
+import logging
+from celery import shared_task
+from django.conf import settings
+from matching.changes import apply_next_batch
+from matching.models import ChangeRecord
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_MAX_BATCHES_PER_RUN = 20
+_DEFAULT_BACKLOG_WARNING = 50_000
+
+
+@shared_task
+def process_change_records() -> int:
+    """
+    Consumes the change record queue in micro-batches (scheduled periodically, see `CELERY_BEAT_SCHEDULE`).
+    Backpressure: a single run applies at most `CHANGE_CAPTURE_MAX_BATCHES_PER_RUN` batches,
+    anything left over is picked up by the next run instead of piling up work on one worker.
+
+    Returns:
+        int: Number of processed change records.
+    """
+    max_batches = getattr(
+        settings, "CHANGE_CAPTURE_MAX_BATCHES_PER_RUN", _DEFAULT_MAX_BATCHES_PER_RUN
+    )
+    processed = 0
+    drained = False
+    try:
+        for _ in range(max_batches):
+            n = apply_next_batch()
+            processed += n
+            if not n:
+                drained = True
+                break
+    finally:
+        # also (and especially) runs if applying failed
+        _check_queue(count_backlog=not drained)
+    return processed
+
+
+def _check_queue(count_backlog: bool) -> None:
+    if count_backlog:
+        backlog = ChangeRecord.objects.filter(failed_at__isnull=True).count()
+        if backlog > getattr(
+            settings, "CHANGE_CAPTURE_BACKLOG_WARNING", _DEFAULT_BACKLOG_WARNING
+        ):
+            logger.warning(
+                f"Change record backlog is growing: {backlog} records pending."
+            )
+    failed = ChangeRecord.objects.filter(failed_at__isnull=False).count()
+    if failed:
+        logger.error(
+            f"{failed} change records failed permanently and are no longer applied (see admin)."
+        )
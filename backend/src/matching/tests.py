@@ -0,0 +1,189 @@
+from datetime import datetime, timezone
+from unittest import mock
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+
+from common_utils.signals import post_bulk_create
+from lol.models import Game
+from matching.changes import apply_next_batch, coalesce
+from matching.models import ChangeRecord
+from matching.tasks import process_change_records
+from messaging.models import Channel, Message, Participant
+
+# changes handed to `recording_refresher`
+refreshed = []
+
+
+def recording_refresher(changes):
+    refreshed.append(changes)
+
+
+def failing_refresher(changes):
+    raise RuntimeError("refresh failed")
+
+
+def games_failing_refresher(changes):
+    # fails for game changes (which have no user) only
+    if None in changes:
+        raise RuntimeError("refresh failed")
+    refreshed.append(changes)
+
+
+def _game(game_id: int) -> Game:
+    return Game(
+        platform="EUW1",
+        game=game_id,
+        champion=1,
+        queue=420,
+        season=13,
+        timestamp=datetime.now(timezone.utc),
+    )
+
+
+class CoalesceTest(TestCase):
+    def test_groups_by_user_and_deduplicates(self):
+        rows = [
+            ("message", "m1", 1, "saved"),
+            ("message", "m1", 1, "saved"),
+            ("participant", "c1", 1, "saved"),
+            ("message", "m2", 2, "saved"),
+            ("game", "10", None, "saved"),
+        ]
+
+        self.assertEqual(
+            coalesce(rows),
+            {
+                1: {"message": {"m1": "saved"}, "participant": {"c1": "saved"}},
+                2: {"message": {"m2": "saved"}},
+                None: {"game": {"10": "saved"}},
+            },
+        )
+
+    def test_keeps_last_action(self):
+        rows = [
+            ("participant", "c1", 1, "saved"),
+            ("participant", "c1", 1, "deleted"),
+            ("participant", "c2", 1, "deleted"),
+            ("participant", "c2", 1, "saved"),
+        ]
+
+        self.assertEqual(
+            coalesce(rows),
+            {1: {"participant": {"c1": "deleted", "c2": "saved"}}},
+        )
+
+
+class ApplyNextBatchTest(TestCase):
+    def setUp(self):
+        refreshed.clear()
+        self.user = get_user_model().objects.create(username="user")
+        channel = Channel.objects.create()
+        self.participant = Participant.objects.create(user=self.user, channel=channel)
+        self.message = Message.objects.create(
+            channel=channel, author=self.participant, content="gg"
+        )
+
+    @override_settings(CHANGE_CAPTURE_REFRESHERS=["matching.tests.failing_refresher"])
+    def test_keeps_records_if_a_refresher_fails(self):
+        with self.assertLogs("matching.changes", level="ERROR"):
+            self.assertEqual(apply_next_batch(), 2)
+
+        self.assertEqual(
+            list(ChangeRecord.objects.values_list("attempts", flat=True)), [1, 1]
+        )
+        # not due again until the retry delay passed
+        self.assertEqual(apply_next_batch(), 0)
+
+    @override_settings(
+        CHANGE_CAPTURE_REFRESHERS=["matching.tests.games_failing_refresher"]
+    )
+    def test_failing_user_does_not_block_others(self):
+        _game(1).save()
+
+        with self.assertLogs("matching.changes", level="ERROR"):
+            apply_next_batch()
+
+        self.assertEqual(
+            list(ChangeRecord.objects.values_list("source", "attempts")),
+            [("game", 1)],
+        )
+        self.assertEqual(list(refreshed[0]), [self.user.id])
+
+    @override_settings(
+        CHANGE_CAPTURE_REFRESHERS=["matching.tests.failing_refresher"],
+        CHANGE_CAPTURE_MAX_ATTEMPTS=2,
+        CHANGE_CAPTURE_RETRY_DELAY=0,
+    )
+    def test_marks_records_as_failed_after_max_attempts(self):
+        with self.assertLogs("matching.changes", level="ERROR"):
+            apply_next_batch()
+            apply_next_batch()
+
+        self.assertEqual(
+            ChangeRecord.objects.filter(failed_at__isnull=False).count(), 2
+        )
+        # failed records are no longer consumed
+        self.assertEqual(apply_next_batch(), 0)
+
+    @override_settings(CHANGE_CAPTURE_REFRESHERS=["matching.tests.recording_refresher"])
+    def test_applies_and_deletes_records(self):
+        self.assertEqual(apply_next_batch(), 2)
+
+        self.assertFalse(ChangeRecord.objects.exists())
+        # the message's author was resolved to its user
+        self.assertEqual(
+            refreshed,
+            [
+                {
+                    self.user.id: {
+                        "participant": {str(self.participant.channel_id): "saved"},
+                        "message": {str(self.message.pk): "saved"},
+                    }
+                }
+            ],
+        )
+
+
+class ProcessChangeRecordsTest(TestCase):
+    @override_settings(CHANGE_CAPTURE_BACKLOG_WARNING=0)
+    def test_checks_queue_if_applying_raises(self):
+        _game(1).save()
+
+        with mock.patch(
+            "matching.tasks.apply_next_batch", side_effect=RuntimeError
+        ), self.assertLogs("matching.tasks", level="WARNING") as logs:
+            with self.assertRaises(RuntimeError):
+                process_change_records()
+
+        self.assertIn("backlog", logs.output[0])
+
+
+class ChangeCaptureTest(TestCase):
+    def test_bulk_create_sends_post_bulk_create(self):
+        received = []
+
+        def receiver(sender, instances, **kwargs):
+            received.append((sender, instances))
+
+        post_bulk_create.connect(receiver, sender=Game)
+        try:
+            games = Game.objects.bulk_create([_game(1), _game(2)])
+        finally:
+            post_bulk_create.disconnect(receiver, sender=Game)
+
+        self.assertEqual(received, [(Game, games)])
+        self.assertEqual(
+            sorted(ChangeRecord.objects.values_list("source", "object_id")),
+            [("game", "1"), ("game", "2")],
+        )
+
+    def test_delete_is_captured(self):
+        game = _game(3)
+        game.save()
+
+        game.delete()
+
+        self.assertEqual(
+            list(ChangeRecord.objects.values_list("action", flat=True)),
+            [ChangeRecord.Action.SAVED, ChangeRecord.Action.DELETED],
+        )
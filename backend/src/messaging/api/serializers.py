@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from messaging.models import Channel
+from src.serializers import ValuesSerializer
 
 
 class ChannelSerializer(serializers.ModelSerializer):
@@ -9,3 +10,13 @@ class ChannelSerializer(serializers.ModelSerializer):
             "id",
             "icon",
         )
+
+
+class ChannelValuesSerializer(ValuesSerializer):
+    """Read-only fast path of ``ChannelSerializer`` (identical output)."""
+
+    fields = (
+        "id",
+        "icon",
+    )
+    converters = {"id": str}
@@ -1,9 +1,12 @@
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.renderers import BrowsableAPIRenderer
 from rest_framework.response import Response
 from rest_framework import status, generics
+from drf_spectacular.utils import extend_schema, extend_schema_view
 
-from messaging.api.serializers import ChannelSerializer
+from messaging.api.serializers import ChannelSerializer, ChannelValuesSerializer
 from messaging.models import Channel, Participant
+from src.renderers import FastJSONRenderer
 
 
 class ChannelCreateView(generics.GenericAPIView):
@@ -17,9 +20,15 @@ class ChannelCreateView(generics.GenericAPIView):
         return Response(data=data, status=status.HTTP_200_OK)
 
 
+# the schema is generated from the (identical) `ModelSerializer`
+@extend_schema_view(get=extend_schema(responses=ChannelSerializer(many=True)))
 class ChannelListView(generics.ListAPIView):
     permission_classes = (IsAuthenticated,)
-    serializer_class = ChannelSerializer
+    serializer_class = ChannelValuesSerializer
+    # the response contains no floats, so it renders identical to the stock `JSONRenderer`
+    renderer_classes = (FastJSONRenderer, BrowsableAPIRenderer)
 
     def get_queryset(self):
-        return Channel.objects.filter(users=self.request.user)
+        return self.serializer_class.values(
+            Channel.objects.filter(users=self.request.user)
+        )
@@ -1,6 +1,7 @@
 import uuid
 from django.conf import settings
 from django.db import models
+from common_utils.signals import BulkSignalQuerySet
 
 
 class Channel(models.Model):
@@ -25,6 +26,8 @@ class Participant(models.Model):
     channel = models.ForeignKey(to="Channel", on_delete=models.CASCADE, db_index=True)
     is_active = models.BooleanField(default=True)
 
+    objects = BulkSignalQuerySet.as_manager()
+
     class Meta:
         unique_together = ("user", "channel")
 
@@ -37,3 +40,5 @@ class Message(models.Model):
     )
     content = models.TextField()
     timestamp = models.TimeField(auto_now_add=True, editable=False)
+
+    objects = BulkSignalQuerySet.as_manager()
@@ -1,3 +1,33 @@
 from django.test import TestCase
+from rest_framework.renderers import JSONRenderer
 
-# Create your tests here.
+from messaging.api.serializers import ChannelSerializer, ChannelValuesSerializer
+from messaging.models import Channel
+from src.renderers import FastJSONRenderer
+
+
+class ChannelValuesSerializerTest(TestCase):
+    def setUp(self):
+        Channel.objects.create(icon=None)
+        Channel.objects.create(icon="https://example.com/icon.png")
+
+    def test_output_equals_model_serializer(self):
+        expected = ChannelSerializer(Channel.objects.all(), many=True).data
+        from_values = ChannelValuesSerializer(
+            ChannelValuesSerializer.values(Channel.objects.all()), many=True
+        ).data
+        from_values_list = ChannelValuesSerializer(
+            ChannelValuesSerializer.values_list(Channel.objects.all()), many=True
+        ).data
+
+        self.assertEqual(from_values, expected)
+        self.assertEqual(from_values_list, expected)
+        self.assertIsInstance(from_values[0]["id"], str)
+        self.assertIn(None, [channel["icon"] for channel in from_values])
+
+    def test_fast_renderer_output_equals_stock_renderer(self):
+        data = ChannelValuesSerializer(
+            ChannelValuesSerializer.values(Channel.objects.all()), many=True
+        ).data
+
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
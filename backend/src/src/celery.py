@@ -1,6 +1,7 @@
 import os
 
 from celery import Celery
+from celery.signals import worker_init
 
 # set the default Django settings module for the 'celery' program.
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "src.settings")
@@ -14,9 +15,21 @@ app = Celery("src")
 app.config_from_object("django.conf:settings", namespace="CELERY")
 
 # Load task modules from all registered Django app configs.
+# (this is lazy: apps are only searched for tasks once the worker starts up)
 app.autodiscover_tasks()
 
 
+@worker_init.connect
+def preload_worker(**kwargs):
+    # runs in the parent process, before the prefork pool is forked
+    from src.preload import preload
+
+    preload()
+
+
+# NOTE: Celery's django fixup takes care of DB connections inherited by the forked children
+
+
 @app.task(bind=True)
 def debug_task(self):
     print(f"Request: {self.request!r}")
@@ -0,0 +1,65 @@
+"""
+Warm-start preloading for pre-fork servers and Celery prefork workers.
+
+`preload` is meant to run ONCE in the parent process, before workers are forked:
+    > sets up django (if not done yet) and imports `settings.PRELOAD_MODULES`
+      (heavy modules that are otherwise imported lazily), logging the time spent on each
+    > imports `settings.ROOT_URLCONF` (and with it all views, DRF, ...) and builds the URL resolver,
+      which would otherwise happen on the first request of every worker
+    > runs `settings.PRELOAD_HOOKS` (e.g. filling caches)
+    > closes all DB connections the hooks opened, so no socket is shared with the forked children
+      (every child opens its own connection on first use)
+    > moves everything loaded so far into the permanent GC generation, so the children
+      don't touch (and thereby copy) those pages during garbage collection
+Forked workers then share the loaded modules and caches copy-on-write.
+
+Usage:
+    > Celery: automatic, see `src.celery`
+    > gunicorn: `--preload` with `SRC_PRELOAD=1` set (see `src.wsgi`)
+"""
+import gc
+import logging
+import time
+import django
+from django.apps import apps
+from django.conf import settings
+from django.db import connections
+from django.urls import get_resolver
+from django.utils.module_loading import import_string
+from common_utils.import_utils import (
+    get_import_timings,
+    record_import_time,
+    timed_import,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def preload() -> None:
+    start = time.perf_counter()
+    if not apps.ready:
+        with record_import_time("django.setup"):
+            django.setup()
+    for module_name in getattr(settings, "PRELOAD_MODULES", ()):
+        timed_import(module_name)
+    with record_import_time(settings.ROOT_URLCONF):
+        resolver = get_resolver()
+        # both are computed (and cached on the resolver) on first access
+        resolver.url_patterns
+        resolver.reverse_dict
+    for hook_path in getattr(settings, "PRELOAD_HOOKS", ()):
+        try:
+            import_string(hook_path)()
+        except Exception:
+            # a cold cache is no reason to not start the worker (it's filled on first use)
+            logger.exception(f"Preload hook {hook_path} failed.")
+
+    connections.close_all()
+    # `gc.freeze` is only available on python >= 3.7
+    if hasattr(gc, "freeze"):
+        gc.collect()
+        gc.freeze()
+
+    logger.info(f"Preloading done in {time.perf_counter() - start:.3f}s.")
+    for module_name, seconds in get_import_timings().items():
+        logger.info(f"  > import {module_name}: {seconds:.3f}s")
@@ -0,0 +1,51 @@
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+class FastJSONRenderer(JSONRenderer):
+    """Faster replacement for DRF's ``JSONRenderer``, enabled per view via ``renderer_classes``.
+    Compact responses are encoded with ``orjson`` (if installed).
+    Falls back to the stock renderer for:
+        > indented output (e.g. ``application/json; indent=4`` or the browsable API)
+        > anything ``orjson`` refuses to encode (e.g. ints > 64 bit)
+    WARNING: the output is only byte-identical to the stock renderer for payloads WITHOUT floats
+    (``orjson`` writes e.g. ``1e16`` instead of ``1e+16`` and ``null`` instead of ``NaN``).
+    Only enable it on views whose responses have been checked (see ``messaging.tests``).
+    """
+
+    if orjson is not None:
+        # datetimes are handed back to DRF's encoder to keep its ISO format (`Z` suffix, ms precision)
+        _orjson_options = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        renderer_context = renderer_context or {}
+        if (
+            orjson is None
+            or not self.compact
+            or self.ensure_ascii
+            or self.get_indent(accepted_media_type, renderer_context) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(
+                data, default=self.encoder_class().default, option=self._orjson_options
+            )
+        except (TypeError, orjson.JSONEncodeError):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # We always fully escape \u2028 and \u2029 (same as the stock renderer).
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+            b"\xe2\x80\xa9", b"\\u2029"
+        )
@@ -0,0 +1,53 @@
+from typing import Any, Callable, Dict, Sequence, Tuple, Union
+
+from rest_framework import serializers
+
+
+class ValuesListSerializer(serializers.ListSerializer):
+    """``ListSerializer`` that skips the per-item ``Manager``/``ReturnDict`` overhead."""
+
+    def to_representation(self, data):
+        to_representation = self.child.to_representation
+        return [to_representation(row) for row in data]
+
+
+class ValuesSerializer(serializers.BaseSerializer):
+    """
+    Read-only serializer for hot list endpoints.
+    Works on ``QuerySet.values(*fields)`` rows (dicts) or ``QuerySet.values_list(*fields)`` rows (tuples)
+    instead of model instances, so no models are instantiated and no per-field ``Field`` objects are run.
+    Usage:
+        > set ``fields`` to the (ordered) output keys, which must equal the queried column names
+        > set ``converters`` for columns whose python value isn't JSON-ready (e.g. ``{"id": str}`` for UUIDs)
+        > query with ``Serializer.values(queryset)`` / ``Serializer.values_list(queryset)``
+    The output has to stay identical to the ``ModelSerializer`` it replaces!
+    """
+
+    fields: Tuple[str, ...] = ()
+    converters: Dict[str, Callable[[Any], Any]] = {}
+
+    class Meta:
+        list_serializer_class = ValuesListSerializer
+
+    @classmethod
+    def values(cls, queryset):
+        return queryset.values(*cls.fields)
+
+    @classmethod
+    def values_list(cls, queryset):
+        return queryset.values_list(*cls.fields)
+
+    def to_representation(
+        self, row: Union[Dict[str, Any], Sequence[Any]]
+    ) -> Dict[str, Any]:
+        if not isinstance(row, dict):
+            row = dict(zip(self.fields, row))
+        converters = self.converters
+        ret = {}
+        for field in self.fields:
+            value = row[field]
+            # same as DRF: `None` is never passed on to the field's `to_representation`
+            if value is not None and field in converters:
+                value = converters[field](value)
+            ret[field] = value
+        return ret
@@ -40,6 +40,7 @@ INSTALLED_APPS = [
     "drf_spectacular",
     "messaging",
     "lol",
+    "matching.apps.MatchingConfig",
 ]
 
 MIDDLEWARE = [
@@ -133,5 +134,40 @@ USE_TZ = True
 STATIC_URL = "/static/"
 
 
+# V--------------- PRELOADING ---------------V
+# Run once in the parent of pre-fork servers / Celery prefork workers (see `src.preload`).
+# Heavy modules that are imported lazily otherwise
+PRELOAD_MODULES = [
+    "requests",
+    "ijson",
+    "lol.riot_interface.ddragon.data_util",
+]
+# Callables (dotted paths) that build shared caches.
+# NOTE: caches filled here are copied into every worker, so they must be able to notice stale data on their own.
+PRELOAD_HOOKS = []
+
+
 # V--------------- CELERY ---------------V
-CELERY_BROKER_URL = "redis://127.0.0.1:6379/0"
\ No newline at end of file
+CELERY_BROKER_URL = "redis://127.0.0.1:6379/0"
+CELERY_BEAT_SCHEDULE = {
+    "process-change-records": {
+        "task": "matching.tasks.process_change_records",
+        "schedule": 60.0,
+        # a run that couldn't start within its interval is superseded by the next one
+        "options": {"expires": 60.0},
+    },
+}
+
+
+# V--------------- CHANGE CAPTURE ---------------V
+# see `matching.changes`
+# Callables (dotted paths) that incrementally update derived matching data.
+# Each is called with the coalesced changes of a batch: {user_id: {source: {object_id: last action}}}
+# (actions are `ChangeRecord.Action` values, i.e. "saved" or "deleted")
+CHANGE_CAPTURE_REFRESHERS = []
+CHANGE_CAPTURE_BATCH_SIZE = 500
+CHANGE_CAPTURE_MAX_BATCHES_PER_RUN = 20
+# failing records are retried after `RETRY_DELAY` seconds, up to `MAX_ATTEMPTS` times
+CHANGE_CAPTURE_MAX_ATTEMPTS = 5
+CHANGE_CAPTURE_RETRY_DELAY = 300
+CHANGE_CAPTURE_BACKLOG_WARNING = 50_000
\ No newline at end of file
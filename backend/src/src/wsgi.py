@@ -13,4 +13,11 @@ from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "src.settings")
 
+# Set for pre-fork servers that load the app in the parent (e.g. `gunicorn --preload`).
+# Runs before `get_wsgi_application`, so the time spent in `django.setup` is logged as well.
+if os.environ.get("SRC_PRELOAD") == "1":
+    from src.preload import preload
+
+    preload()
+
 application = get_wsgi_application()